@@ -9,23 +9,56 @@ various output files, including XLSX, CSV, and formatted text files.
 """
 import json
 import datetime
+import typing
+import functools
 import logging
 import math
 import argparse
 import csv
-import pandas as pd
+import numpy as np
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
 
+# orjson parses the solved-schedule JSON several times faster than the
+# stdlib; fall back silently when it is not installed.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # --- Setup Logging ---
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
 
-def format_duration(duration_delta):
-    """Formats a timedelta object into a human-readable string."""
-    total_seconds = int(duration_delta.total_seconds())
-    hours, remainder = divmod(total_seconds, 3600)
-    minutes, _ = divmod(remainder, 60)
+# Shared style singletons. openpyxl dedupes styles on save, so handing every
+# cell the exact same instances keeps its style table at a handful of entries.
+_BOLD_FONT = Font(bold=True)
+_FILLS = {
+    "Driving": PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid"),
+    "Spotting": PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid"),
+    "Resting": PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
+}
+_THIN_BORDER = Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
+_CENTER_ALIGN = Alignment(horizontal='center', vertical='center', wrap_text=True)
+
+# The 96 quarter-hour row labels are identical on every calendar sheet, so
+# format them exactly once.
+_TIME_SLOT_LABELS = [f"{h:02d}:{m:02d}" for h in range(24) for m in range(0, 60, 15)]
+
+class _Duty(typing.NamedTuple):
+    """One consolidated itinerary block in a member's local time. A slotted
+    tuple is far lighter than the 3-key dicts these replaced, and attribute
+    access skips the per-key hashing in the report loops."""
+    start_local: datetime.datetime
+    end_local: datetime.datetime
+    activity: str
+
+@functools.lru_cache(maxsize=256)
+def _format_duration_hm(hours, minutes):
+    """Builds the duration string for an (hours, minutes) pair; most stints
+    share a duration, so the cache answers nearly every call."""
     parts = []
     if hours > 0:
         parts.append(f"{hours} hour{'s' if hours > 1 else ''}")
@@ -33,36 +66,69 @@ def format_duration(duration_delta):
         parts.append(f"{minutes} minute{'s' if minutes > 1 else ''}")
     return "for " + " and ".join(parts) if parts else ""
 
+@functools.lru_cache(maxsize=8)
+def _parse_race_start(race_start_utc):
+    """Parses raceStartUTC once with fromisoformat (much faster than
+    strptime) and shares the result across the report functions. The
+    trailing 'Z' is stripped to keep the datetime naive, matching the
+    rest of the UTC arithmetic."""
+    return datetime.datetime.fromisoformat(race_start_utc.rstrip('Z'))
+
+def _format_ts(dt):
+    """'%Y-%m-%d %H:%M:%S' via f-string, skipping strftime's format
+    compiler on the per-stint hot path."""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+
+@functools.lru_cache(maxsize=None)
+def _activity_str(activity_type, first, last):
+    """Activity label for a consolidated block; the handful of distinct
+    (type, stint range) keys means the cache serves repeated runs directly."""
+    if first == last:
+        return f"{activity_type} Stint #{first}"
+    return f"{activity_type} Stints #{first}-{last}"
+
+def format_duration(duration_delta):
+    """Formats a timedelta object into a human-readable string."""
+    total_seconds = int(duration_delta.total_seconds())
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, _ = divmod(remainder, 60)
+    return _format_duration_hm(hours, minutes)
+
 def generate_member_itineraries(schedule, data, pit_time_seconds, has_spotters):
     """Generates a detailed, localized itinerary for each team member."""
     logging.info("--- Generating Per-Member Itineraries ---")
     raw_duties = {member['name']: [] for member in data['teamMembers']}
     
     for entry in schedule:
-        start_time_utc = datetime.datetime.strptime(entry['startTimeUTC'], '%Y-%m-%d %H:%M:%S')
-        end_time_utc = datetime.datetime.strptime(entry['endTimeUTC'], '%Y-%m-%d %H:%M:%S')
+        start_time_utc = entry['start_dt']
+        end_time_utc = entry['end_dt']
         stint_num = entry['stint']
         
-        if entry['driver'] != "N/A" and entry['driver'] in raw_duties:
-            raw_duties[entry['driver']].append({
+        # Single .get() per assignment instead of an 'in' test followed by
+        # a second lookup for the append.
+        duties = raw_duties.get(entry['driver'])
+        if duties is not None and entry['driver'] != "N/A":
+            duties.append({
                 "start_utc": start_time_utc,
                 "end_utc": end_time_utc,
                 "activity_type": "Driving",
                 "stint": stint_num
             })
-        
-        if has_spotters and entry['spotter'] != "N/A" and entry['spotter'] in raw_duties:
-            raw_duties[entry['spotter']].append({
-                "start_utc": start_time_utc,
-                "end_utc": end_time_utc,
-                "activity_type": "Spotting",
-                "stint": stint_num
-            })
+
+        if has_spotters:
+            duties = raw_duties.get(entry['spotter'])
+            if duties is not None and entry['spotter'] != "N/A":
+                duties.append({
+                    "start_utc": start_time_utc,
+                    "end_utc": end_time_utc,
+                    "activity_type": "Spotting",
+                    "stint": stint_num
+                })
             
     final_itineraries = {}
-    race_start_utc = datetime.datetime.strptime(data['raceStartUTC'], "%Y-%m-%dT%H:%M:%S.%fZ")
+    race_start_utc = _parse_race_start(data['raceStartUTC'])
     race_end_utc = race_start_utc + datetime.timedelta(hours=data['durationHours'])
-    tz_map = {member['name']: int(member.get('timezone', 0)) for member in data['teamMembers']}
+    tz_offsets = {member['name']: datetime.timedelta(hours=int(member.get('timezone', 0))) for member in data['teamMembers']}
 
     for name, duties in raw_duties.items():
         if not duties:
@@ -70,47 +136,48 @@ def generate_member_itineraries(schedule, data, pit_time_seconds, has_spotters):
             continue
         
         duties.sort(key=lambda x: x['start_utc'])
-        
+
+        # Stint boundaries are exact to the second, so contiguity is a plain
+        # integer comparison against the pit time; blocks accumulate in local
+        # variables instead of per-duty dict copies.
         consolidated = []
-        if duties:
-            current_block = duties[0].copy()
-            current_block['stints'] = [current_block.pop('stint')]
-
-            for next_duty in duties[1:]:
-                is_contiguous = (next_duty['activity_type'] == current_block['activity_type'] and math.isclose((next_duty['start_utc'] - current_block['end_utc']).total_seconds(), pit_time_seconds))
-                if is_contiguous:
-                    current_block['end_utc'] = next_duty['end_utc']
-                    current_block['stints'].append(next_duty['stint'])
-                else:
-                    consolidated.append(current_block)
-                    current_block = next_duty.copy()
-                    current_block['stints'] = [current_block.pop('stint')]
-            consolidated.append(current_block)
+        block = duties[0]
+        block_end, block_stints = block['end_utc'], [block['stint']]
+        for next_duty in duties[1:]:
+            gap_seconds = int((next_duty['start_utc'] - block_end).total_seconds())
+            if next_duty['activity_type'] == block['activity_type'] and gap_seconds == pit_time_seconds:
+                block_end = next_duty['end_utc']
+                block_stints.append(next_duty['stint'])
+            else:
+                consolidated.append({'start_utc': block['start_utc'], 'end_utc': block_end,
+                                     'activity_type': block['activity_type'], 'stints': block_stints})
+                block = next_duty
+                block_end, block_stints = block['end_utc'], [block['stint']]
+        consolidated.append({'start_utc': block['start_utc'], 'end_utc': block_end,
+                             'activity_type': block['activity_type'], 'stints': block_stints})
 
         final_itineraries[name] = []
-        offset = datetime.timedelta(hours=tz_map.get(name, 0))
+        offset = tz_offsets.get(name, datetime.timedelta(0))
         last_duty_end_local = race_start_utc + offset
 
         for duty in consolidated:
             start_local, end_local = duty['start_utc'] + offset, duty['end_utc'] + offset
             
-            gap_seconds = (start_local - last_duty_end_local).total_seconds()
-            if gap_seconds > 1 and not math.isclose(gap_seconds, pit_time_seconds):
-                final_itineraries[name].append({"start_local": last_duty_end_local, "end_local": start_local, "activity": "Resting"})
+            # Gaps are whole seconds, so a plain integer compare replaces
+            # the old math.isclose tolerance check.
+            gap_seconds = int((start_local - last_duty_end_local).total_seconds())
+            if gap_seconds > 1 and gap_seconds != pit_time_seconds:
+                final_itineraries[name].append(_Duty(last_duty_end_local, start_local, "Resting"))
             
-            activity_type = duty['activity_type']
             stints = duty['stints']
-            if len(stints) == 1:
-                activity_str = f"{activity_type} Stint #{stints[0]}"
-            else:
-                activity_str = f"{activity_type} Stints #{stints[0]}-{stints[-1]}"
+            activity_str = _activity_str(duty['activity_type'], stints[0], stints[-1])
 
-            final_itineraries[name].append({"start_local": start_local, "end_local": end_local, "activity": activity_str})
+            final_itineraries[name].append(_Duty(start_local, end_local, activity_str))
             last_duty_end_local = end_local
 
         race_end_local = race_end_utc + offset
         if (race_end_local - last_duty_end_local).total_seconds() > 1:
-            final_itineraries[name].append({"start_local": last_duty_end_local, "end_local": race_end_local, "activity": "Resting"})
+            final_itineraries[name].append(_Duty(last_duty_end_local, race_end_local, "Resting"))
         
     return final_itineraries
 
@@ -129,14 +196,21 @@ def write_output(schedule, data, filename, format):
         spotter_pool = [m for m in data['teamMembers'] if m.get('isSpotter')]
         spotter_summary = {p['name']: {'stints': 0} for p in spotter_pool}
 
-    current_time = datetime.datetime.strptime(data['raceStartUTC'], "%Y-%m-%dT%H:%M:%S.%fZ")
+    current_time = _parse_race_start(data['raceStartUTC'])
+    # Stint and pit durations are constant, so build each timedelta once
+    # instead of reallocating them on every loop pass.
+    stint_delta = datetime.timedelta(seconds=stint_laps * data['avgLapTimeInSeconds'])
+    pit_delta = datetime.timedelta(seconds=pit_time_seconds)
     for assignment in schedule:
         start_time = current_time
-        end_time = current_time + datetime.timedelta(seconds=stint_laps * data['avgLapTimeInSeconds'])
+        end_time = current_time + stint_delta
         
+        # The raw datetimes ride along so the itinerary generator never has to
+        # re-parse the formatted strings with strptime.
         entry = {
-            "stint": assignment['stint'], "startTimeUTC": start_time.strftime('%Y-%m-%d %H:%M:%S'),
-            "endTimeUTC": end_time.strftime('%Y-%m-%d %H:%M:%S'), "driver": assignment['driver'], "laps": stint_laps
+            "stint": assignment['stint'], "startTimeUTC": _format_ts(start_time),
+            "endTimeUTC": _format_ts(end_time), "driver": assignment['driver'], "laps": stint_laps,
+            "start_dt": start_time, "end_dt": end_time
         }
         if has_spotters:
             entry["spotter"] = assignment.get('spotter', 'N/A')
@@ -147,7 +221,7 @@ def write_output(schedule, data, filename, format):
             driver_summary[entry['driver']]['stints'] += 1
             driver_summary[entry['driver']]['laps'] += stint_laps
         
-        current_time = end_time + datetime.timedelta(seconds=pit_time_seconds)
+        current_time = end_time + pit_delta
     
     member_itineraries = generate_member_itineraries(final_schedule, data, pit_time_seconds, has_spotters)
 
@@ -158,24 +232,49 @@ def write_output(schedule, data, filename, format):
     elif format == 'txt':
         _write_to_txt(final_schedule, driver_summary, spotter_summary, member_itineraries, filename)
 
+def _set_column_widths(ws, num_columns, width=25):
+    """Presets column widths; write-only sheets require this before any rows."""
+    for i in range(1, num_columns + 1):
+        ws.column_dimensions[get_column_letter(i)].width = width
+
+def _styled_cell_maker(ws, fill):
+    """Returns a factory for calendar cells with the fill, border and
+    alignment baked in, so the row loop only supplies the value."""
+    def make(value):
+        cell = WriteOnlyCell(ws, value=value)
+        cell.fill = fill
+        cell.border = _THIN_BORDER
+        cell.alignment = _CENTER_ALIGN
+        return cell
+    return make
+
 def _write_to_xlsx(schedule, driver_summary, spotter_summary, member_itineraries, filename):
-    """Writes all data to a multi-sheet XLSX file."""
+    """
+    Writes all data to a multi-sheet XLSX file using openpyxl's write-only
+    mode, which streams rows straight to the zip instead of keeping every
+    Cell object in memory until save.
+    """
     logging.info(f"Writing full schedule to XLSX: {filename}")
-    wb = Workbook()
-    ws_summary = wb.active
-    ws_summary.title = "Summaries"
-    bold_font = Font(bold=True)
-    
-    ws_summary.cell(row=1, column=1, value="Driver Summary").font = bold_font
-    ws_summary.append(["Driver", "Total Stints", "Total Laps"])
-    for cell in ws_summary["2:2"]: cell.font = bold_font
+    wb = Workbook(write_only=True)
+
+    def bold_row(ws, values):
+        cells = []
+        for value in values:
+            cell = WriteOnlyCell(ws, value=value)
+            cell.font = _BOLD_FONT
+            cells.append(cell)
+        return cells
+
+    ws_summary = wb.create_sheet("Summaries")
+    _set_column_widths(ws_summary, 3)
+    ws_summary.append(bold_row(ws_summary, ["Driver Summary"]))
+    ws_summary.append(bold_row(ws_summary, ["Driver", "Total Stints", "Total Laps"]))
     for name, stats in driver_summary.items(): ws_summary.append([name, stats['stints'], stats['laps']])
-    
+
     if spotter_summary:
-        next_row = ws_summary.max_row + 2
-        ws_summary.cell(row=next_row, column=1, value="Spotter Summary").font = bold_font
-        ws_summary.append(["Spotter", "Total Stints"])
-        for cell in ws_summary[f"{next_row+1}:{next_row+1}"]: cell.font = bold_font
+        ws_summary.append([])
+        ws_summary.append(bold_row(ws_summary, ["Spotter Summary"]))
+        ws_summary.append(bold_row(ws_summary, ["Spotter", "Total Stints"]))
         for name, stats in spotter_summary.items():
             if stats['stints'] > 0: ws_summary.append([name, stats['stints']])
 
@@ -183,8 +282,8 @@ def _write_to_xlsx(schedule, driver_summary, spotter_summary, member_itineraries
     headers = ["Stint", "Start Time (UTC)", "End Time (UTC)", "Assigned Driver"]
     if spotter_summary: headers.append("Assigned Spotter")
     headers.append("Laps")
-    ws_master.append(headers)
-    for cell in ws_master["1:1"]: cell.font = bold_font
+    _set_column_widths(ws_master, len(headers))
+    ws_master.append(bold_row(ws_master, headers))
     for entry in schedule:
         row = [entry['stint'], entry['startTimeUTC'], entry['endTimeUTC'], entry['driver']]
         if spotter_summary: row.append(entry['spotter'])
@@ -192,63 +291,53 @@ def _write_to_xlsx(schedule, driver_summary, spotter_summary, member_itineraries
         ws_master.append(row)
 
     # --- Per-Member Itinerary Calendar Sheets ---
-    fills = {
-        "Driving": PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid"),
-        "Spotting": PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid"),
-        "Resting": PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
-    }
-    thin_border = Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
-    center_align = Alignment(horizontal='center', vertical='center', wrap_text=True)
-
     for name, itinerary in member_itineraries.items():
         if not itinerary: continue
         
         ws_member = wb.create_sheet(name[:30])
         
-        start_date = itinerary[0]['start_local'].date()
-        end_date = itinerary[-1]['end_local'].date()
-        if itinerary[-1]['end_local'].time() == datetime.time(0, 0):
+        start_date = itinerary[0].start_local.date()
+        end_date = itinerary[-1].end_local.date()
+        if itinerary[-1].end_local.time() == datetime.time(0, 0):
             end_date -= datetime.timedelta(days=1)
         
-        date_range = pd.date_range(start_date, end_date)
-        
-        columns = [date.strftime('%Y-%m-%d') for date in date_range]
-        index = [f"{h:02d}:{m:02d}" for h in range(24) for m in range(0, 60, 15)]
-        df = pd.DataFrame(index=index, columns=columns)
-
-        for date_str in df.columns:
-            for time_str in df.index:
-                slot_start_time = datetime.datetime.strptime(f"{date_str} {time_str}", '%Y-%m-%d %H:%M')
-                slot_end_time = slot_start_time + datetime.timedelta(minutes=15)
-                
-                activity_for_slot = "Resting"
-                for duty in itinerary:
-                    if duty['start_local'] < slot_end_time and duty['end_local'] > slot_start_time:
-                        activity_for_slot = duty['activity']
-                        break
-                
-                df.loc[time_str, date_str] = activity_for_slot
-        
-        ws_member.cell(row=1, column=1, value=f"Schedule for {name}").font = bold_font
-        ws_member.cell(row=2, column=1, value="Time (Local)").font = bold_font
-        for c_idx, col_name in enumerate(df.columns, 2):
-            ws_member.cell(row=2, column=c_idx, value=col_name).font = bold_font
-        
-        for r_idx, row_name in enumerate(df.index, 3):
-            ws_member.cell(row=r_idx, column=1, value=row_name)
-
-        for r_idx, row in enumerate(df.values, 3):
-            for c_idx, value in enumerate(row, 2):
-                cell = ws_member.cell(row=r_idx, column=c_idx, value=str(value) if pd.notna(value) else "")
-                activity_type = str(value).split(' ')[0]
-                cell.fill = fills.get(activity_type, fills["Resting"])
-                cell.border = thin_border
-                cell.alignment = center_align
-
-    for sheet in wb.worksheets:
-        for col in sheet.columns:
-            sheet.column_dimensions[get_column_letter(col[0].column)].width = 25
-    
+        num_days = (end_date - start_date).days + 1
+        columns = [(start_date + datetime.timedelta(days=i)).strftime('%Y-%m-%d') for i in range(num_days)]
+
+        # Paint duties onto a flat coded grid of 15-minute slots with slice
+        # assignment instead of scanning the itinerary per cell. Iterating in
+        # reverse keeps the earlier duty on a slot two duties share.
+        num_slots = num_days * 96
+        grid_origin = datetime.datetime.combine(start_date, datetime.time(0))
+        grid = np.zeros(num_slots, dtype=np.int16)
+        activity_names = ["Resting"]
+        activity_codes = {}
+        for duty in reversed(itinerary):
+            code = activity_codes.get(duty.activity)
+            if code is None:
+                activity_names.append(duty.activity)
+                code = len(activity_names) - 1
+                activity_codes[duty.activity] = code
+            start_idx = max(0, int((duty.start_local - grid_origin).total_seconds() // 900))
+            end_idx = min(num_slots, math.ceil((duty.end_local - grid_origin).total_seconds() / 900))
+            grid[start_idx:end_idx] = code
+
+        slot_rows = np.array(activity_names, dtype=object)[grid].reshape(num_days, 96).T
+        # One preconfigured cell factory per distinct activity string; the
+        # inner loop then just dispatches instead of picking fills apart
+        # with split() per cell.
+        maker_by_activity = {n: _styled_cell_maker(ws_member, _FILLS.get(n.split(' ')[0], _FILLS["Resting"]))
+                             for n in activity_names}
+
+        _set_column_widths(ws_member, 1 + num_days)
+        ws_member.append(bold_row(ws_member, [f"Schedule for {name}"]))
+        ws_member.append(bold_row(ws_member, ["Time (Local)"] + columns))
+
+        for row_name, row in zip(_TIME_SLOT_LABELS, slot_rows):
+            cells = [WriteOnlyCell(ws_member, value=row_name)]
+            cells.extend(maker_by_activity[value](value) for value in row)
+            ws_member.append(cells)
+
     wb.save(filename)
 
 def _write_to_csv(schedule, filename, has_spotters):
@@ -257,45 +346,56 @@ def _write_to_csv(schedule, filename, has_spotters):
     headers = ["Stint", "Start Time (UTC)", "End Time (UTC)", "Assigned Driver"]
     if has_spotters: headers.append("Assigned Spotter")
     headers.append("Laps")
-    with open(filename, 'w', newline='') as f:
+    # writerows drains the generator inside the csv module's C loop, and the
+    # large buffer keeps small rows from turning into per-row syscalls. The
+    # spotter branch is hoisted out of the row generator.
+    with open(filename, 'w', newline='', buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(headers)
-        for entry in schedule:
-            row = [entry['stint'], entry['startTimeUTC'], entry['endTimeUTC'], entry['driver']]
-            if has_spotters: row.append(entry['spotter'])
-            row.append(entry['laps'])
-            writer.writerow(row)
+        if has_spotters:
+            writer.writerows([e['stint'], e['startTimeUTC'], e['endTimeUTC'], e['driver'], e['spotter'], e['laps']] for e in schedule)
+        else:
+            writer.writerows([e['stint'], e['startTimeUTC'], e['endTimeUTC'], e['driver'], e['laps']] for e in schedule)
 
 def _write_to_txt(schedule, driver_summary, spotter_summary, member_itineraries, filename):
     """Writes all schedule data to a text file."""
     logging.info(f"Generating TXT to file: {filename}")
-    with open(filename, 'w') as f:
-        f.write("--- DRIVER SUMMARY ---\n" + "="*80 + "\n")
-        f.write(f"{'Driver':<20} | {'Total Stints':<15} | {'Total Laps':<15}\n" + "-"*80 + "\n")
-        for name, stats in driver_summary.items(): f.write(f"{name:<20} | {stats['stints']:<15} | {stats['laps']:<15}\n")
-
-        if spotter_summary:
-            f.write("\n--- SPOTTER SUMMARY ---\n" + "="*80 + "\n")
-            f.write(f"{'Spotter':<20} | {'Total Stints':<15}\n" + "-"*80 + "\n")
-            for name, stats in spotter_summary.items():
-                if stats['stints'] > 0: f.write(f"{name:<20} | {stats['stints']:<15}\n")
-        
-        f.write("\n--- MASTER SCHEDULE (UTC) ---\n" + "="*80 + "\n")
-        headers = f"{'Stint':<7} | {'Start Time (UTC)':<22} | {'End Time (UTC)':<22} | {'Driver':<15}"
-        if spotter_summary: headers += f" | {'Spotter':<15}"
-        f.write(headers + "\n")
-        f.write("-" * (len(headers) + 10) + "\n")
-        for entry in schedule:
-            row = f"{entry['stint']:<7} | {entry['startTimeUTC']:<22} | {entry['endTimeUTC']:<22} | {entry['driver']:<15}"
-            if spotter_summary: row += f" | {entry['spotter']:<15}"
-            f.write(row + "\n")
-
-        f.write("\n--- MEMBER ITINERARIES (LOCAL TIME) ---\n" + "="*80 + "\n")
-        for name, itinerary in member_itineraries.items():
-            if not itinerary: continue
-            f.write(f"\n--- Itinerary for {name} ---\n")
-            for duty in itinerary:
-                f.write(f"  {duty['start_local'].strftime('%Y-%m-%d %H:%M')} to {duty['end_local'].strftime('%H:%M')} -> {duty['activity']} {format_duration(duty['end_local'] - duty['start_local'])}\n")
+    # The report is assembled in a list and flushed with one write; hundreds
+    # of small f.write calls cost more in buffered-IO bookkeeping than the
+    # string join does.
+    out = []
+    out.append("--- DRIVER SUMMARY ---\n" + "="*80 + "\n")
+    out.append(f"{'Driver':<20} | {'Total Stints':<15} | {'Total Laps':<15}\n" + "-"*80 + "\n")
+    for name, stats in driver_summary.items(): out.append(f"{name:<20} | {stats['stints']:<15} | {stats['laps']:<15}\n")
+
+    if spotter_summary:
+        out.append("\n--- SPOTTER SUMMARY ---\n" + "="*80 + "\n")
+        out.append(f"{'Spotter':<20} | {'Total Stints':<15}\n" + "-"*80 + "\n")
+        for name, stats in spotter_summary.items():
+            if stats['stints'] > 0: out.append(f"{name:<20} | {stats['stints']:<15}\n")
+
+    out.append("\n--- MASTER SCHEDULE (UTC) ---\n" + "="*80 + "\n")
+    headers = f"{'Stint':<7} | {'Start Time (UTC)':<22} | {'End Time (UTC)':<22} | {'Driver':<15}"
+    if spotter_summary: headers += f" | {'Spotter':<15}"
+    out.append(headers + "\n")
+    out.append("-" * (len(headers) + 10) + "\n")
+    # The spotter branch is hoisted so each row is a single f-string
+    # evaluation instead of a format-then-concatenate pair per entry.
+    if spotter_summary:
+        out.extend(f"{e['stint']:<7} | {e['startTimeUTC']:<22} | {e['endTimeUTC']:<22} | {e['driver']:<15} | {e['spotter']:<15}\n" for e in schedule)
+    else:
+        out.extend(f"{e['stint']:<7} | {e['startTimeUTC']:<22} | {e['endTimeUTC']:<22} | {e['driver']:<15}\n" for e in schedule)
+
+    out.append("\n--- MEMBER ITINERARIES (LOCAL TIME) ---\n" + "="*80 + "\n")
+    for name, itinerary in member_itineraries.items():
+        if not itinerary: continue
+        out.append(f"\n--- Itinerary for {name} ---\n")
+        for duty in itinerary:
+            s, e = duty.start_local, duty.end_local
+            out.append(f"  {s.year:04d}-{s.month:02d}-{s.day:02d} {s.hour:02d}:{s.minute:02d} to {e.hour:02d}:{e.minute:02d} -> {duty.activity} {format_duration(e - s)}\n")
+
+    with open(filename, 'w', buffering=1 << 20) as f:
+        f.write(''.join(out))
 
 def main():
     """Main function to parse arguments, read data, and generate formatted output."""
@@ -306,8 +406,8 @@ def main():
     args = parser.parse_args()
 
     try:
-        with open(args.input_file, 'r') as f:
-            solved_data = json.load(f)
+        with open(args.input_file, 'rb') as f:
+            solved_data = _json_loads(f.read())
         write_output(solved_data['schedule'], solved_data['raceData'], args.output_file, args.format)
     except Exception as e:
         logging.error(f"Failed to generate output: {e}", exc_info=True)
@@ -8,20 +8,92 @@ using linear optimization to assign drivers and spotters to stints.
 :license: MIT, see LICENSE for more details.
 """
 import json
+import calendar
 import datetime
+import functools
 import logging
 import math
 import sys
 import argparse
+import os
 import pulp
 import numpy as np
 import time
 
+# orjson reads and writes the schedule JSON several times faster than the
+# stdlib; fall back silently when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def setup_logging(quiet=False):
     """Configures logging based on the quiet flag."""
     log_level = logging.WARNING if quiet else logging.INFO
     logging.basicConfig(level=log_level, format='%(asctime)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
 
+def make_solver(backend, time_limit, optimality_gap, threads=None, warm_start=False):
+    """Builds the PuLP solver command object for the requested backend."""
+    threads = threads or os.cpu_count()
+    if backend == 'highs':
+        # Prefer the in-process highspy bindings: no MPS file round-trip and no
+        # subprocess fork, which can rival the solve itself on large models.
+        if pulp.HiGHS().available():
+            return pulp.HiGHS(msg=False, timeLimit=time_limit, gapRel=optimality_gap, threads=threads)
+        solver = pulp.HiGHS_CMD(msg=False, timeLimit=time_limit, gapRel=optimality_gap, threads=threads, warmStart=warm_start, keepFiles=False)
+    else:
+        solver = pulp.PULP_CBC_CMD(msg=0, timeLimit=time_limit, gapRel=optimality_gap, threads=threads, warmStart=warm_start, keepFiles=False)
+    # Command-line backends round-trip the model through MPS/solution files;
+    # stage those on tmpfs when available so they never touch real storage.
+    if os.access('/dev/shm', os.W_OK):
+        solver.tmpDir = '/dev/shm'
+    return solver
+
+def _apply_greedy_warm_start(work_vars, participants, total_stints):
+    """
+    Seeds the decision variables with a feasible greedy round-robin assignment
+    so the MIP solver starts from an incumbent instead of from scratch.
+    """
+    assigned_counts = {p['name']: 0 for p in participants}
+    consecutive_limits = {p['name']: p['preferredStints'] for p in participants}
+    previous, consecutive = None, 0
+    for s in range(total_stints):
+        candidates = [p['name'] for p in participants if (p['name'], s) in work_vars]
+        if not candidates:
+            continue
+        eligible = [n for n in candidates if n != previous or consecutive < consecutive_limits[n]]
+        # Fewest stints so far wins; break ties away from the previous worker
+        # to minimize back-to-back repeats.
+        choice = min(eligible or candidates, key=lambda n: (assigned_counts[n], n == previous))
+        for name in candidates:
+            work_vars[(name, s)].setInitialValue(1 if name == choice else 0)
+        assigned_counts[choice] += 1
+        consecutive = consecutive + 1 if choice == previous else 1
+        previous = choice
+
+# Constraint names only matter when dumping the LP to inspect it by hand;
+# building thousands of f-strings measurably slows model build, so they are
+# skipped when running under python -O.
+NAME_CONSTRAINTS = __debug__
+
+@functools.lru_cache(maxsize=8)
+def _availability_keys(race_start_utc_str, stint_with_pit_seconds, num_stints):
+    """Hourly availability keys per stint. Cached so the sequential and
+    integrated modes, which build driver and spotter models over the same
+    race, only derive them once."""
+    race_start_utc = datetime.datetime.strptime(race_start_utc_str, "%Y-%m-%dT%H:%M:%S.%fZ")
+    race_start_epoch = calendar.timegm(race_start_utc.timetuple())
+    key_by_epoch = {}
+    avail_keys = []
+    for s in range(num_stints):
+        hour_epoch = (race_start_epoch + int(s * stint_with_pit_seconds)) // 3600 * 3600
+        key = key_by_epoch.get(hour_epoch)
+        if key is None:
+            key = datetime.datetime.fromtimestamp(hour_epoch, datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+            key_by_epoch[hour_epoch] = key
+        avail_keys.append(key)
+    return tuple(avail_keys)
+
 def _add_participant_model(prob, data, participants, stints, var_prefix, stint_laps, stint_with_pit_seconds, allow_no_spotter=False):
     """
     Adds a generic set of variables, constraints, and objectives for a participant type (driver or spotter).
@@ -29,75 +101,148 @@ def _add_participant_model(prob, data, participants, stints, var_prefix, stint_l
     if not participants:
         return prob, {}
 
+    # Precompute the hourly availability key for every stint and the resulting
+    # per-(participant, stint) status lookups once, instead of re-deriving them
+    # inside both the objective and constraint loops below.
+    avail_keys = _availability_keys(data['raceStartUTC'], stint_with_pit_seconds, len(stints))
+    # A single (participant, stint) status matrix; vectorized comparisons
+    # replace the former per-pair Python dict churn.
+    names = [p['name'] for p in participants]
+    status = np.array([[data['availability'][n].get(k, 'Unavailable') for k in avail_keys] for n in names])
+    available = status != 'Unavailable'
+    preferred = status == 'Preferred'
+
     # --- Variables ---
-    work_vars = pulp.LpVariable.dicts(var_prefix, ((p['name'], s) for p in participants for s in stints), cat='Binary')
-    switch_vars = pulp.LpVariable.dicts(f"{var_prefix}Switch", ((p['name'], s) for p in participants for s in stints if s > 0), cat='Binary')
+    # Only create variables for (participant, stint) pairs that are actually
+    # available. Absent keys read as a constant 0 through dict.get, so the
+    # unavailable assignments never enter the model and the former
+    # equality-to-zero constraints are unnecessary.
+    work_vars = {
+        (names[pi], s): pulp.LpVariable(f"{var_prefix}_{names[pi].replace(' ', '_')}_{s}", cat='Binary')
+        for pi in range(len(names)) for s in stints if available[pi, s]
+    }
+    # Continuous is enough for the switch indicators: their only constraint is
+    # the lower bound below and the objective minimizes them, so they settle at
+    # exactly max(0, x_s - x_{s-1}) without burdening branch-and-bound with
+    # extra binaries.
+    switch_vars = {
+        (name, s): pulp.LpVariable(f"{var_prefix}Switch_{name.replace(' ', '_')}_{s}", 0, 1)
+        for (name, s) in work_vars if s > 0
+    }
     max_work_stints = pulp.LpVariable(f"Max{var_prefix}Stints", 0, None, 'Integer')
     min_work_stints = pulp.LpVariable(f"Min{var_prefix}Stints", 0, None, 'Integer')
 
+    # Group each participant's variables once so the per-participant lpSum
+    # calls below iterate flat lists instead of rebuilding keys per constraint.
+    vars_by_name = {p['name']: [] for p in participants}
+    for (name, s), var in work_vars.items():
+        vars_by_name[name].append(var)
+
     # --- Objective Function ---
+    # Building LpAffineExpression from (var, coeff) pairs in one shot skips the
+    # repeated in-place additions lpSum performs per term.
     balance_objective = (max_work_stints - min_work_stints) * 1000
-    switch_objective = pulp.lpSum(switch_vars.get((p['name'], s), 0) for p in participants for s in stints if s > 0) * 100
-
-    preference_scores = {}
-    race_start_utc = datetime.datetime.strptime(data['raceStartUTC'], "%Y-%m-%dT%H:%M:%S.%fZ")
-    for s in stints:
-        stint_start_time = race_start_utc + datetime.timedelta(seconds=s * stint_with_pit_seconds)
-        key_time = stint_start_time.replace(minute=0, second=0, microsecond=0)
-        availability_key = key_time.strftime('%Y-%m-%dT%H:%M:%S.000Z')
-        for p in participants:
-            if data['availability'][p['name']].get(availability_key) == 'Preferred':
-                preference_scores[(p['name'], s)] = 1
-            else:
-                preference_scores[(p['name'], s)] = 0
-    
-    preference_objective = -pulp.lpSum(work_vars[(p['name'], s)] * preference_scores.get((p['name'], s), 0) for p in participants for s in stints)
+    switch_objective = pulp.LpAffineExpression([(var, 100) for var in switch_vars.values()])
+    preference_objective = pulp.LpAffineExpression([(work_vars[(names[pi], int(s))], -1) for pi, s in np.argwhere(preferred)])
     prob.objective += balance_objective + switch_objective + preference_objective
 
     # --- Constraints ---
-    for s in stints:
-        stint_start_time = race_start_utc + datetime.timedelta(seconds=s * stint_with_pit_seconds)
-        key_time = stint_start_time.replace(minute=0, second=0, microsecond=0)
-        availability_key = key_time.strftime('%Y-%m-%dT%H:%M:%S.000Z')
-        for p in participants:
-            is_available = data['availability'][p['name']].get(availability_key, 'Unavailable') != 'Unavailable'
-            if not is_available:
-                prob += work_vars[(p['name'], s)] == 0, f"Unavailable{var_prefix}_{p['name']}_{s}"
-            if s > 0:
-                prob += switch_vars[(p['name'], s)] >= work_vars[(p['name'], s)] - work_vars[(p['name'], s - 1)]
+    # The switch indicators only need this lower bound: the objective minimizes
+    # them, so nothing ever pushes one to 1 unnecessarily and no upper-bound
+    # linearization constraints are required.
+    for (name, s), switch_var in switch_vars.items():
+        prob += switch_var >= work_vars[(name, s)] - work_vars.get((name, s - 1), 0)
 
     total_laps = len(stints) * stint_laps
     equal_share_laps = total_laps / len(participants) if participants else 0
     min_laps_per_participant = math.ceil(0.25 * equal_share_laps)
     min_stints_per_participant = math.ceil(min_laps_per_participant / stint_laps) if stint_laps > 0 else 0
 
+    totals_by_name = {}
     for p in participants:
         name = p['name']
-        total_participant_stints = pulp.lpSum(work_vars[(name, s)] for s in stints)
-        prob += max_work_stints >= total_participant_stints, f"DefineMax{var_prefix}_{name}"
-        prob += min_work_stints <= total_participant_stints, f"DefineMin{var_prefix}_{name}"
+        total_participant_stints = pulp.LpAffineExpression([(var, 1) for var in vars_by_name[name]])
+        totals_by_name[name] = total_participant_stints
+        prob += max_work_stints >= total_participant_stints, (f"DefineMax{var_prefix}_{name}" if NAME_CONSTRAINTS else None)
+        prob += min_work_stints <= total_participant_stints, (f"DefineMin{var_prefix}_{name}" if NAME_CONSTRAINTS else None)
         
         if var_prefix == 'Drive':
-            prob += total_participant_stints >= min_stints_per_participant, f"FairShare{var_prefix}_{name}"
+            prob += total_participant_stints >= min_stints_per_participant, (f"FairShare{var_prefix}_{name}" if NAME_CONSTRAINTS else None)
 
         max_consecutive = p['preferredStints']
-        for s in range(len(stints) - max_consecutive):
-            prob += pulp.lpSum(work_vars[(name, s + i)] for i in range(max_consecutive + 1)) <= max_consecutive, f"MaxConsecutive{var_prefix}_{name}_{s}"
-
+        num_stints = len(stints)
         min_rest_hours = p.get('minimumRestHours', 0)
+        min_rest_stints = 0
         if min_rest_hours > 0 and stint_with_pit_seconds > 0:
             min_rest_stints = math.floor((min_rest_hours * 3600) / stint_with_pit_seconds)
-            if min_rest_stints > 0:
-                possible_rest_starts = range(len(stints) - min_rest_stints + 1)
-                rest_block_achieved = pulp.LpVariable.dicts(f"RestAchieved{var_prefix}_{name}", possible_rest_starts, cat='Binary')
-                prob += pulp.lpSum(rest_block_achieved[s] for s in possible_rest_starts) >= 1, f"MustHaveOneRest{var_prefix}_{name}"
-                M = min_rest_stints + 1
-                for s in possible_rest_starts:
-                    prob += pulp.lpSum(work_vars[(name, s + i)] for i in range(min_rest_stints)) <= M * (1 - rest_block_achieved[s]), f"EnforceRest{var_prefix}_{name}_{s}"
+
+        if num_stints > max_consecutive or min_rest_stints > 0:
+            # Rolling-sum reformulation: express each window over this
+            # participant's stints as a difference of a running total, so
+            # every window constraint carries 2-3 nonzeros instead of one per
+            # stint in the window. Both the consecutive-stint cap and the
+            # rest-block windows below share the same chain.
+            running = pulp.LpVariable.dicts(f"Cum{var_prefix}_{name}", range(num_stints), 0, None, 'Integer')
+            prob += running[0] == work_vars.get((name, 0), 0), (f"DefineCum{var_prefix}_{name}_0" if NAME_CONSTRAINTS else None)
+            for s in range(1, num_stints):
+                prob += running[s] == running[s - 1] + work_vars.get((name, s), 0), (f"DefineCum{var_prefix}_{name}_{s}" if NAME_CONSTRAINTS else None)
+
+        if num_stints > max_consecutive:
+            # The windows cover every start index through the one ending at
+            # the final stint.
+            for s in range(num_stints - max_consecutive):
+                window_sum = running[s + max_consecutive] - (running[s - 1] if s > 0 else 0)
+                prob += window_sum <= max_consecutive, (f"MaxConsecutive{var_prefix}_{name}_{s}" if NAME_CONSTRAINTS else None)
+
+        if min_rest_stints > 0:
+            possible_rest_starts = range(num_stints - min_rest_stints + 1)
+            rest_block_achieved = pulp.LpVariable.dicts(f"RestAchieved{var_prefix}_{name}", possible_rest_starts, cat='Binary')
+            prob += pulp.lpSum(rest_block_achieved[s] for s in possible_rest_starts) >= 1, (f"MustHaveOneRest{var_prefix}_{name}" if NAME_CONSTRAINTS else None)
+            M = min_rest_stints + 1
+            for s in possible_rest_starts:
+                window_sum = running[s + min_rest_stints - 1] - (running[s - 1] if s > 0 else 0)
+                prob += window_sum <= M * (1 - rest_block_achieved[s]), (f"EnforceRest{var_prefix}_{name}_{s}" if NAME_CONSTRAINTS else None)
+
+    # --- Symmetry Breaking ---
+    # Participants with identical profiles yield permutation-symmetric
+    # solutions that the solver explores redundantly. Order each
+    # interchangeable group by total stint count: swapping two identical
+    # members permutes their totals, so every orbit contains a solution with
+    # the totals sorted and no feasible schedule or objective value is cut
+    # off. (Stronger per-prefix orderings are not safe here: a valid schedule
+    # can interleave two identical members so that neither dominates the
+    # other's cumulative workload at every prefix.) Dual-role members and a
+    # pinned first-stint driver are excluded because their assignments are
+    # not freely permutable.
+    groups = {}
+    for pi, p in enumerate(participants):
+        if p['name'] == data.get('firstStintDriver') or (p.get('isDriver') and p.get('isSpotter')):
+            continue
+        profile = (p['preferredStints'], p.get('minimumRestHours', 0), tuple(status[pi]))
+        groups.setdefault(profile, []).append(p['name'])
+    for group in groups.values():
+        for first, second in zip(group, group[1:]):
+            prob += totals_by_name[first] >= totals_by_name[second], (f"Symmetry{var_prefix}_{first}_{second}" if NAME_CONSTRAINTS else None)
 
     return prob, work_vars
 
-def solve_schedule(data, time_limit, spotter_mode='none', allow_no_spotter=False, optimality_gap=0.0):
+def _group_vars_by_stint(work_vars, total_stints):
+    """Buckets a sparse {(name, stint): var} dict into per-stint sum expressions."""
+    vars_by_stint = [[] for _ in range(total_stints)]
+    for (_, s), var in work_vars.items():
+        vars_by_stint[s].append((var, 1))
+    return [pulp.LpAffineExpression(pairs) for pairs in vars_by_stint]
+
+def _add_spotter_coverage(prob, spot_vars, total_stints, allow_no_spotter):
+    """Adds the per-stint spotter coverage constraints shared by both spotter modes."""
+    spot_vars_by_stint = _group_vars_by_stint(spot_vars, total_stints)
+    for s in range(total_stints):
+        if allow_no_spotter:
+            prob += spot_vars_by_stint[s] <= 1, (f"AtMostOneSpotter_Stint_{s}" if NAME_CONSTRAINTS else None)
+        else:
+            prob += spot_vars_by_stint[s] == 1, (f"ExactlyOneSpotter_Stint_{s}" if NAME_CONSTRAINTS else None)
+
+def solve_schedule(data, time_limit, spotter_mode='none', allow_no_spotter=False, optimality_gap=0.0, solver_backend='cbc', threads=None, warm_start=False):
     """Main function to formulate and solve the scheduling problem based on the chosen mode."""
     lap_time_seconds = data['avgLapTimeInSeconds']
     pit_time_seconds = data['pitTimeInSeconds']
@@ -110,24 +255,40 @@ def solve_schedule(data, time_limit, spotter_mode='none', allow_no_spotter=False
     driver_pool = [m for m in data['teamMembers'] if m.get('isDriver')]
     spotter_pool = [m for m in data['teamMembers'] if m.get('isSpotter')] if spotter_mode != 'none' else []
     
-    logging.info(f"--- Building a '{spotter_mode}' schedule with {total_stints} stints ---")
+    logging.info("--- Building a '%s' schedule with %d stints ---", spotter_mode, total_stints)
     prob = pulp.LpProblem("Race_Scheduling", pulp.LpMinimize)
     
     prob, drive_vars = _add_participant_model(prob, data, driver_pool, stints, "Drive", stint_laps, stint_with_pit_seconds)
+    drive_vars_by_stint = _group_vars_by_stint(drive_vars, total_stints)
     for s in stints:
-        prob += pulp.lpSum(drive_vars[(m['name'], s)] for m in driver_pool) == 1, f"OneDriver_Stint_{s}"
-    
+        prob += drive_vars_by_stint[s] == 1, (f"OneDriver_Stint_{s}" if NAME_CONSTRAINTS else None)
+
+    # Presolve-style fixing: a stint with exactly one available driver is
+    # forced by the coverage equality above, so pin that binary before the
+    # model is handed over and spare branch-and-bound the non-choice.
+    candidates_per_stint = {}
+    for (name, s) in drive_vars:
+        candidates_per_stint.setdefault(s, []).append(name)
+    for s, stint_candidates in candidates_per_stint.items():
+        if len(stint_candidates) == 1:
+            var = drive_vars[(stint_candidates[0], s)]
+            var.setInitialValue(1)
+            var.fixValue()
+
     if data.get('firstStintDriver'):
         first_driver_name = data['firstStintDriver']
         if any(d['name'] == first_driver_name for d in driver_pool):
-            logging.info(f"Adding constraint: First stint must be driven by {first_driver_name}")
-            prob += drive_vars[(first_driver_name, 0)] == 1, "FirstStintDriver"
+            logging.info("Adding constraint: First stint must be driven by %s", first_driver_name)
+            prob += pulp.lpSum(drive_vars.get((first_driver_name, 0), 0)) == 1, "FirstStintDriver"
         else:
-            logging.warning(f"FirstStintDriver '{first_driver_name}' is not an eligible driver. Constraint ignored.")
+            logging.warning("FirstStintDriver '%s' is not an eligible driver. Constraint ignored.", first_driver_name)
+
+    if warm_start:
+        _apply_greedy_warm_start(drive_vars, driver_pool, total_stints)
 
     spot_vars = {}
     solve_duration = 0.0
-    solver = pulp.PULP_CBC_CMD(msg=0, timeLimit=time_limit, gapRel=optimality_gap)
+    solver = make_solver(solver_backend, time_limit, optimality_gap, threads, warm_start)
 
     if spotter_mode == 'sequential' and spotter_pool:
         logging.info("--- Sequential Mode: Step 1: Solving for Drivers ---")
@@ -135,61 +296,64 @@ def solve_schedule(data, time_limit, spotter_mode='none', allow_no_spotter=False
         prob.solve(solver)
         end_time_1 = time.time()
         solve_duration += (end_time_1 - start_time_1)
-        logging.info(f"Driver solve finished in {solve_duration:.2f} seconds.")
+        logging.info("Driver solve finished in %.2f seconds.", solve_duration)
         
         if prob.status != pulp.LpStatusOptimal:
-            logging.error(f"Could not find an optimal driver schedule. Status: {pulp.LpStatus[prob.status]}")
+            logging.error("Could not find an optimal driver schedule. Status: %s", pulp.LpStatus[prob.status])
             return None, None, None, None, None, None, None, None, None
 
-        fixed_driver_schedule = {(d['name'], s): pulp.value(drive_vars[(d['name'], s)]) for d in driver_pool for s in stints}
+        fixed_driver_schedule = {key: pulp.value(var) for key, var in drive_vars.items()}
         
         logging.info("--- Sequential Mode: Step 2: Solving for Spotters ---")
         spotter_prob = pulp.LpProblem("Spotter_Scheduling", pulp.LpMinimize)
         spotter_prob, spot_vars = _add_participant_model(spotter_prob, data, spotter_pool, stints, "Spot", stint_laps, stint_with_pit_seconds, allow_no_spotter)
-        
-        for s in stints:
-            if allow_no_spotter:
-                spotter_prob += pulp.lpSum(spot_vars[(m['name'], s)] for m in spotter_pool) <= 1, f"AtMostOneSpotter_Stint_{s}"
-            else:
-                spotter_prob += pulp.lpSum(spot_vars[(m['name'], s)] for m in spotter_pool) == 1, f"ExactlyOneSpotter_Stint_{s}"
-        
+
+        _add_spotter_coverage(spotter_prob, spot_vars, total_stints, allow_no_spotter)
+
+        members_by_name = {m['name']: m for m in data['teamMembers']}
         for (name, s), is_driving in fixed_driver_schedule.items():
-            member = next((m for m in data['teamMembers'] if m['name'] == name), None)
-            if is_driving > 0.5 and member and member.get('isSpotter'):
-                spotter_prob += spot_vars[(name, s)] == 0, f"NoSpotWhileDriving_{name}_{s}"
-        
+            member = members_by_name.get(name)
+            if is_driving > 0.5 and member and member.get('isSpotter') and (name, s) in spot_vars:
+                spotter_prob += spot_vars[(name, s)] == 0, (f"NoSpotWhileDriving_{name}_{s}" if NAME_CONSTRAINTS else None)
+
+        if warm_start:
+            _apply_greedy_warm_start(spot_vars, spotter_pool, total_stints)
+
         prob = spotter_prob
 
     elif spotter_mode == 'integrated' and spotter_pool:
         logging.info("--- Integrated Mode: Solving for Drivers and Spotters Simultaneously ---")
         prob, spot_vars = _add_participant_model(prob, data, spotter_pool, stints, "Spot", stint_laps, stint_with_pit_seconds, allow_no_spotter)
-        for s in stints:
-            if allow_no_spotter:
-                prob += pulp.lpSum(spot_vars[(m['name'], s)] for m in spotter_pool) <= 1, f"AtMostOneSpotter_Stint_{s}"
-            else:
-                prob += pulp.lpSum(spot_vars[(m['name'], s)] for m in spotter_pool) == 1, f"ExactlyOneSpotter_Stint_{s}"
-        
-        for member in data['teamMembers']:
-            if member.get('isDriver') and member.get('isSpotter'):
-                for s in stints:
-                    prob += drive_vars[(member['name'], s)] + spot_vars[(member['name'], s)] <= 1, f"NoDriveAndSpot_{member['name']}_{s}"
+        _add_spotter_coverage(prob, spot_vars, total_stints, allow_no_spotter)
 
-    logging.info(f"--- Solving... (Time limit: {time_limit}s, Optimality gap: {optimality_gap*100}%) ---")
+        # Only members who can both drive and spot ever need the exclusion
+        # constraints; single-role members are filtered out up front.
+        dual_role_members = [m for m in data['teamMembers'] if m.get('isDriver') and m.get('isSpotter')]
+        for member in dual_role_members:
+            name = member['name']
+            for s in stints:
+                if (name, s) in drive_vars and (name, s) in spot_vars:
+                    prob += drive_vars[(name, s)] + spot_vars[(name, s)] <= 1, (f"NoDriveAndSpot_{name}_{s}" if NAME_CONSTRAINTS else None)
+
+        if warm_start:
+            _apply_greedy_warm_start(spot_vars, spotter_pool, total_stints)
+
+    logging.info("--- Solving... (Time limit: %ss, Optimality gap: %s%%) ---", time_limit, optimality_gap * 100)
     start_time = time.time()
     prob.solve(solver)
     end_time = time.time()
     
     final_solve_duration = end_time - start_time
     solve_duration += final_solve_duration
-    logging.info(f"Final solve step finished in {final_solve_duration:.2f} seconds.")
-    logging.info(f"Total solver time: {solve_duration:.2f} seconds.")
+    logging.info("Final solve step finished in %.2f seconds.", final_solve_duration)
+    logging.info("Total solver time: %.2f seconds.", solve_duration)
     
     return prob, data, total_stints, stint_laps, driver_pool, spotter_pool, drive_vars, spot_vars, solve_duration
 
 def process_results(prob, total_stints, driver_pool, spotter_pool, drive_vars, spot_vars):
     """Processes the PuLP result and prepares the schedule assignments."""
     if prob.status not in [pulp.LpStatusOptimal, pulp.LpStatusNotSolved]:
-        logging.error(f"Solver failed. Status: {pulp.LpStatus[prob.status]}")
+        logging.error("Solver failed. Status: %s", pulp.LpStatus[prob.status])
         return None
     if prob.status == pulp.LpStatusNotSolved and prob.solutionState() == pulp.LpSolutionInfeasible:
         logging.error("Solver failed because the model is infeasible.")
@@ -198,16 +362,21 @@ def process_results(prob, total_stints, driver_pool, spotter_pool, drive_vars, s
     if prob.status == pulp.LpStatusNotSolved:
         logging.warning("Solver stopped due to time limit or optimality gap before proving optimality. A valid schedule was likely found.")
 
+    # One pass over the sparse variable dicts instead of rescanning the whole
+    # pool per stint; the per-stint assignment constraints guarantee at most
+    # one active name per stint, so a stint-keyed dict captures the solution.
+    driver_by_stint = {s: name for (name, s), var in drive_vars.items() if (var.varValue or 0) > 0.5}
+    spotter_by_stint = {}
+    if spotter_pool:
+        spotter_by_stint = {s: name for (name, s), var in spot_vars.items() if (var.varValue or 0) > 0.5}
+
     schedule = []
     for s in range(total_stints):
-        assigned_driver = next((d['name'] for d in driver_pool if pulp.value(drive_vars.get((d['name'], s))) > 0.5), "N/A")
-        
-        entry = {"stint": s + 1, "driver": assigned_driver}
+        entry = {"stint": s + 1, "driver": driver_by_stint.get(s, "N/A")}
         if spotter_pool:
-            assigned_spotter = next((p['name'] for p in spotter_pool if pulp.value(spot_vars.get((p['name'], s))) > 0.5), "N/A")
-            entry["spotter"] = assigned_spotter
+            entry["spotter"] = spotter_by_stint.get(s, "N/A")
         schedule.append(entry)
-        
+
     return schedule
 
 def main():
@@ -220,20 +389,26 @@ def main():
     parser.add_argument('--spotter-mode', choices=['none', 'integrated', 'sequential'], default='none', help="Method for scheduling spotters.")
     parser.add_argument('--allow-no-spotter', action='store_true', help="Allow stints to have no spotter assigned.")
     parser.add_argument('--optimality-gap', type=float, default=0.0, help="Solver stops when the gap to the optimal solution is less than this value (e.g., 0.01 for 1%%). Default is 0 (proven optimal).")
+    parser.add_argument('--solver', choices=['cbc', 'highs'], default='cbc', help="MIP solver backend. HiGHS is typically faster but requires the 'highs' executable on the PATH.")
+    parser.add_argument('--threads', type=int, default=None, help="Number of solver threads. Defaults to all available cores.")
+    parser.add_argument('--warm-start', action='store_true', help="Seed the solver with a greedy round-robin schedule to prune the search early.")
     args = parser.parse_args()
 
     setup_logging(args.quiet)
 
     try:
         if args.input_file:
-            with open(args.input_file, 'r') as f: data = json.load(f)
+            if orjson is not None:
+                with open(args.input_file, 'rb') as f: data = orjson.loads(f.read())
+            else:
+                with open(args.input_file, 'r') as f: data = json.load(f)
         else:
             data = json.load(sys.stdin)
     except Exception as e:
-        logging.error(f"Failed to read or parse input data: {e}"); return
+        logging.error("Failed to read or parse input data: %s", e); return
 
     prob, data, total_stints, stint_laps, driver_pool, spotter_pool, drive_vars, spot_vars, solve_duration = solve_schedule(
-        data, args.time_limit, args.spotter_mode, args.allow_no_spotter, args.optimality_gap
+        data, args.time_limit, args.spotter_mode, args.allow_no_spotter, args.optimality_gap, args.solver, args.threads, args.warm_start
     )
     
     if prob is None: return
@@ -256,7 +431,10 @@ def main():
                 "schedule": schedule_assignments,
                 "solveDurationSeconds": solve_duration
             }
-            with open(args.output, 'w') as f: json.dump(output_data, f, indent=4)
+            if orjson is not None:
+                with open(args.output, 'wb') as f: f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(args.output, 'w') as f: json.dump(output_data, f, indent=4)
         logging.info("Solver finished successfully.")
 
 if __name__ == '__main__':
